@@ -6,6 +6,11 @@ from dotenv import load_dotenv
 from easydict import EasyDict
 import functools
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 SCRIPT_DIR = dirname(realpath(__file__))
 
@@ -15,7 +20,9 @@ if isfile(".env"):
 
 # Load config
 with open(join(SCRIPT_DIR, "dm.conf.yml"), "r") as cf:
-    config = EasyDict(yaml.safe_load(cf))[environ.get("DM_ENV", "default")]
+    config = EasyDict(yaml.load(cf, Loader=SafeLoader))[
+        environ.get("DM_ENV", "default")
+    ]
 
 
 def configuration_callback(
@@ -30,7 +37,7 @@ def configuration_callback(
     sync_config_file = join(ctx.params[option_name], ".sync.yml")
     if isfile(sync_config_file):
         with open(sync_config_file, "r") as cf:
-            sync_config = yaml.safe_load(cf)
+            sync_config = yaml.load(cf, Loader=SafeLoader)
     for param in ctx.params.keys():
         if param != option_name:
             ctx.params[param] = (
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-from lk import api
 import click
 from helpers import TableOutput as T, Message as M
 from sys import argv
@@ -12,6 +11,9 @@ from config import options_from_source
 @click.option("-q", "--query", envvar="LK_QUERY", required=True)
 @click.option("-c", "--columns", envvar="LK_COLUMNS", required=False, multiple=True)
 def get(schema: str, query: str, columns: tuple = ()):
+    # Imported here so commands without LabKey access don't pay for it
+    from lk import api
+
     results = api.query.select_rows(schema_name=schema, query_name=query)
     T.out(results["rows"], headers=columns)
     available_columns = [r for r in results["rows"][0].keys()]